@@ -12,7 +12,13 @@ import fitz  # PyMuPDF
 import pytesseract
 from PIL import Image, ImageTk
 import io
+import os
+import multiprocessing
+import subprocess
 import threading
+import collections
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import numpy as np
 
 # Set Tesseract path for Windows
@@ -21,6 +27,18 @@ pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tessera
 # Lazy load OCR engines
 _easyocr_reader = None
 _winocr_available = None
+_tess_api = None
+# PyTessBaseAPI holds per-image state, so only one thread may use it at a time
+_tess_lock = threading.Lock()
+
+
+def _cuda_available():
+    """Check if EasyOCR can run on a CUDA GPU"""
+    try:
+        import torch
+        return torch.cuda.is_available()
+    except ImportError:
+        return False
 
 
 def get_easyocr_reader():
@@ -28,10 +46,36 @@ def get_easyocr_reader():
     global _easyocr_reader
     if _easyocr_reader is None:
         import easyocr
-        _easyocr_reader = easyocr.Reader(['en'], gpu=False)
+        # On CPU EasyOCR dynamic-quantizes the detector and recognizer to int8
+        _easyocr_reader = easyocr.Reader(['en'], gpu=_cuda_available(), quantize=True)
     return _easyocr_reader
 
 
+def _pix_to_array(pix):
+    """View a PyMuPDF pixmap as a (height, width, channels) numpy array"""
+    return np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
+
+
+def get_tesserocr_api():
+    """Lazy load in-process Tesseract API (None if tesserocr isn't usable)"""
+    global _tess_api
+    if _tess_api is None:
+        try:
+            import tesserocr
+        except ImportError:
+            _tess_api = False
+        else:
+            # Use the tessdata that ships with the configured Tesseract install
+            tessdata = os.path.join(os.path.dirname(pytesseract.pytesseract.tesseract_cmd), 'tessdata')
+            kwargs = {'path': tessdata} if os.path.isdir(tessdata) else {}
+            try:
+                _tess_api = tesserocr.PyTessBaseAPI(lang='eng', **kwargs)
+            except RuntimeError:
+                # Missing tessdata or eng.traineddata; don't retry on every call
+                _tess_api = False
+    return _tess_api or None
+
+
 def check_winocr_available():
     """Check if Windows OCR is available"""
     global _winocr_available
@@ -51,6 +95,14 @@ class OCREngine:
     EASYOCR = "EasyOCR"
     WINDOWS_OCR = "Windows OCR"
     
+    # Pages per batched OCR call, bounds memory on long documents
+    BATCH_SIZE = 8
+    
+    # Tesseract gains nothing past ~300 DPI, it only gets slower. Sits just
+    # above A4/Letter/Legal at 300 DPI (3509/3300/4200 px) so normal OCR
+    # renders aren't resampled for nothing
+    TESSERACT_MAX_SIDE = 4200
+    
     @staticmethod
     def get_available_engines():
         """Return list of available OCR engines"""
@@ -82,59 +134,260 @@ class OCREngine:
         else:
             raise ValueError(f"Unknown OCR engine: {engine_name}")
     
+    @staticmethod
+    def perform_ocr_batch(images, engine_name):
+        """Perform OCR on several images, batching where the engine supports it"""
+        if engine_name == OCREngine.EASYOCR:
+            return OCREngine._easyocr_ocr_batch(images)
+        elif engine_name == OCREngine.WINDOWS_OCR:
+            return OCREngine._windows_ocr_batch(images)
+        else:
+            return [OCREngine.perform_ocr(image, engine_name) for image in images]
+    
+    @staticmethod
+    def _to_pil(image):
+        """Wrap a numpy array as a PIL Image, pass PIL Images through"""
+        if isinstance(image, np.ndarray):
+            return Image.fromarray(image)
+        return image
+    
     @staticmethod
     def _tesseract_ocr(image):
         """Perform OCR using Tesseract"""
-        return pytesseract.image_to_string(image)
+        image = OCREngine._to_pil(image)
+        
+        # Downscale oversized images before recognition
+        w, h = image.size
+        max_side = max(w, h)
+        if max_side > OCREngine.TESSERACT_MAX_SIDE:
+            scale = OCREngine.TESSERACT_MAX_SIDE
+            image = image.resize((w * scale // max_side, h * scale // max_side), Image.LANCZOS)
+        
+        # Prefer libtesseract in-process, skipping the subprocess and temp file
+        with _tess_lock:
+            api = get_tesserocr_api()
+            if api is not None:
+                api.SetImage(image)
+                return api.GetUTF8Text()
+        
+        return OCREngine._tesseract_pipe_ocr(image)
+    
+    @staticmethod
+    def _tesseract_pipe_ocr(image):
+        """Perform OCR by piping the image through the tesseract executable"""
+        # Uncompressed TIFF encodes much faster than the PNG pytesseract
+        # writes, and stdin/stdout skips its temp files on disk
+        buf = io.BytesIO()
+        image.save(buf, format="TIFF")
+        
+        kwargs = {}
+        if os.name == 'nt':
+            # Don't flash a console window for every page
+            kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
+        
+        cmd = [pytesseract.pytesseract.tesseract_cmd, 'stdin', 'stdout']
+        try:
+            proc = subprocess.run(cmd, input=buf.getvalue(), capture_output=True, **kwargs)
+        except FileNotFoundError:
+            raise pytesseract.TesseractNotFoundError()
+        if proc.returncode != 0:
+            raise pytesseract.TesseractError(proc.returncode, proc.stderr.decode('utf-8', 'replace').strip())
+        return proc.stdout.decode('utf-8')
     
     @staticmethod
     def _easyocr_ocr(image):
         """Perform OCR using EasyOCR"""
         reader = get_easyocr_reader()
-        # Convert PIL Image to numpy array
-        img_array = np.array(image)
+        # EasyOCR takes arrays directly; PIL Images are viewed without a copy
+        img_array = np.asarray(image)
         results = reader.readtext(img_array, detail=0, paragraph=True)
         return '\n'.join(results)
     
+    @staticmethod
+    def _easyocr_ocr_batch(images):
+        """Perform OCR on several images with batched EasyOCR calls"""
+        reader = get_easyocr_reader()
+        images = [np.asarray(image) for image in images]
+        
+        # readtext_batched stacks its input, so group images by size
+        by_shape = {}
+        for index, img_array in enumerate(images):
+            by_shape.setdefault(img_array.shape, []).append(index)
+        
+        texts = [None] * len(images)
+        for indices in by_shape.values():
+            batch = [images[i] for i in indices]
+            results = reader.readtext_batched(batch, detail=0, paragraph=True, batch_size=len(batch))
+            for index, result in zip(indices, results):
+                texts[index] = '\n'.join(result)
+        return texts
+    
     @staticmethod
     def _windows_ocr(image):
         """Perform OCR using Windows OCR"""
         import winocr
         import asyncio
         
-        # Run async OCR
+        image = OCREngine._to_pil(image)
+        
+        # Run async OCR on a fresh event loop
         async def do_ocr():
             result = await winocr.recognize_pil(image, 'en')
             return result.text
         
-        # Get or create event loop
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        return asyncio.run(do_ocr())
+    
+    @staticmethod
+    def _windows_ocr_batch(images):
+        """Perform OCR on several images concurrently using Windows OCR"""
+        import winocr
+        import asyncio
         
-        return loop.run_until_complete(do_ocr())
+        images = [OCREngine._to_pil(image) for image in images]
+        
+        # One event loop for the whole batch instead of one per image
+        async def do_ocr():
+            results = await asyncio.gather(*[winocr.recognize_pil(image, 'en') for image in images])
+            return [result.text for result in results]
+        
+        return asyncio.run(do_ocr())
+
+
+def _share_easyocr_reader():
+    """Load an fp32 EasyOCR reader here with its weights in shared memory, so
+    pool workers can map them instead of loading their own copy.
+    
+    This is a second model next to the quantized get_easyocr_reader() one and
+    is rebuilt for every pool. Hold it only while the pool runs: workers map
+    the shared memory as they spawn, so it can't be freed any earlier.
+    """
+    if _cuda_available():
+        # CUDA weights don't go through shared memory, the worker loads its own
+        return None
+    
+    import easyocr
+    import torch.multiprocessing
+    torch.multiprocessing.set_sharing_strategy('file_system')
+    # Quantized packed weights lose their scale/zero point when torch
+    # pickles them for another process, so share the fp32 model and let
+    # each worker quantize its own copy
+    reader = easyocr.Reader(['en'], gpu=False, quantize=False)
+    reader.detector.share_memory()
+    reader.recognizer.share_memory()
+    return reader
+
+
+def _worker_init(engine_name, num_threads, shared_reader=None):
+    """Process pool initializer: build the OCR engine once per worker"""
+    global _easyocr_reader
+    if engine_name == OCREngine.TESSERACT:
+        # The pool already runs one Tesseract per core; stop each from also
+        # starting an OpenMP thread per core. tesserocr reads this when it
+        # initializes, the tesseract CLI inherits it.
+        os.environ['OMP_THREAD_LIMIT'] = '1'
+    elif engine_name == OCREngine.EASYOCR:
+        import torch
+        # Split the cores between workers instead of each one using all of them
+        torch.set_num_threads(num_threads)
+        if shared_reader is not None:
+            # Unpickled as a thin Reader around the parent's shared tensors.
+            # Quantize the same way EasyOCR does on CPU; only the LSTM and
+            # Linear layers get private int8 copies, the convolutions stay shared
+            for model in (shared_reader.detector, shared_reader.recognizer):
+                torch.quantization.quantize_dynamic(model, dtype=torch.qint8, inplace=True)
+            _easyocr_reader = shared_reader
+        else:
+            # Reader setup takes seconds; every page this worker sees reuses it
+            get_easyocr_reader()
+
+
+def _existing_text(page):
+    """Return the page's text layer if it looks like real text, else None"""
+    text = page.get_text("text").strip()
+    # Short or mostly non-letter text layers are usually stray marks, OCR those
+    if len(text) > 50 and sum(c.isalpha() for c in text) / len(text) > 0.5:
+        return text
+    return None
+
+
+def _ocr_pages_worker(pdf_path, page_nums, engine_name, zoom, skip_text_pages=False, render_lock=None):
+    """Render and OCR a run of pages (runs in a worker process)
+    
+    Returns (page_num, text, from_text_layer) for each page. When called on a
+    thread of the GUI process, pass render_lock: MuPDF has one global context,
+    so rendering must not overlap the preview even for separate documents.
+    """
+    results = {}
+    text_layer_pages = set()
+    ocr_page_nums = []
+    images = []
+    
+    # The lock only covers rendering, OCR runs without it
+    with render_lock or contextlib.nullcontext():
+        # PyMuPDF documents are not picklable, so each worker opens its own handle
+        doc = fitz.open(pdf_path)
+        try:
+            matrix = fitz.Matrix(zoom, zoom)
+            for page_num in page_nums:
+                page = doc[page_num]
+                text = _existing_text(page) if skip_text_pages else None
+                if text is not None:
+                    # Page already has a text layer, no need to rasterize or OCR it
+                    results[page_num] = text
+                    text_layer_pages.add(page_num)
+                else:
+                    ocr_page_nums.append(page_num)
+                    images.append(_pix_to_array(page.get_pixmap(matrix=matrix)))
+        finally:
+            doc.close()
+    
+    if images:
+        results.update(zip(ocr_page_nums, OCREngine.perform_ocr_batch(images, engine_name)))
+    return [(page_num, results[page_num], page_num in text_layer_pages) for page_num in page_nums]
 
 
 class PDFOCRApp:
+    # Rendered pages kept around for page flips and re-zooms
+    PAGE_CACHE_SIZE = 16
+    # Of those, how many keep their Tk image (the rest keep only the PIL Image)
+    PHOTO_CACHE_SIZE = 2
+    
     def __init__(self, root):
         self.root = root
         self.root.title("PDF OCR Tool")
         self.root.geometry("1200x800")
         
         self.pdf_document = None
+        self.pdf_path = None
         self.current_page = 0
         self.total_pages = 0
         self.current_image = None
         self.photo_image = None
-        self.selection_start = None
+        # Selection drag start point (None when no drag is in progress)
+        self._sx = None
+        self._sy = None
         self.selection_rect = None
         self.zoom_level = 1.0
+        # OCR renders at its own resolution, independent of the preview zoom
+        self.ocr_dpi = 300
+        
+        # (page_num, zoom_level) -> (PIL Image, PhotoImage), oldest first
+        self._page_cache = collections.OrderedDict()
+        # Guards the document and page cache against the prefetch thread
+        self._render_lock = threading.Lock()
         
         # OCR engine selection
         self.available_engines = OCREngine.get_available_engines()
         self.selected_engine = tk.StringVar(value=self.available_engines[0])
+        self.skip_text_pages = tk.BooleanVar(value=False)
+        
+        # OCR jobs share one executor. Every submit bumps the generation; only
+        # the newest job may write to the output panel, older ones stop early
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._ocr_future = None
+        self._ocr_generation = 0
+        self._closing = threading.Event()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         self.setup_ui()
         
@@ -188,6 +441,7 @@ class PDFOCRApp:
         ttk.Button(toolbar2, text="OCR Current Page", command=self.ocr_current_page).pack(side=tk.LEFT, padx=2)
         ttk.Button(toolbar2, text="OCR Selection", command=self.ocr_selection).pack(side=tk.LEFT, padx=2)
         ttk.Button(toolbar2, text="OCR Entire Document", command=self.ocr_entire_document).pack(side=tk.LEFT, padx=2)
+        ttk.Checkbutton(toolbar2, text="Skip pages with existing text", variable=self.skip_text_pages).pack(side=tk.LEFT, padx=5)
         
         # Engine info label
         self.engine_info = ttk.Label(toolbar2, text="", foreground="gray")
@@ -217,6 +471,9 @@ class PDFOCRApp:
         h_scroll.pack(side=tk.BOTTOM, fill=tk.X)
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
+        # Selection rectangle is created once and moved with coords()
+        self.sel_item = self.canvas.create_rectangle(0, 0, 0, 0, outline="red", width=2, state="hidden")
+        
         # Bind mouse events for selection
         self.canvas.bind("<ButtonPress-1>", self.on_mouse_press)
         self.canvas.bind("<B1-Motion>", self.on_mouse_drag)
@@ -251,9 +508,12 @@ class PDFOCRApp:
         )
         if file_path:
             try:
-                if self.pdf_document:
-                    self.pdf_document.close()
-                self.pdf_document = fitz.open(file_path)
+                with self._render_lock:
+                    if self.pdf_document:
+                        self.pdf_document.close()
+                    self.pdf_document = fitz.open(file_path)
+                    self.pdf_path = file_path
+                    self._page_cache.clear()
                 self.total_pages = len(self.pdf_document)
                 self.current_page = 0
                 self.zoom_level = 1.0
@@ -267,30 +527,92 @@ class PDFOCRApp:
         if not self.pdf_document:
             return
             
-        page = self.pdf_document[self.current_page]
-        
-        # Render page to image with zoom
-        matrix = fitz.Matrix(self.zoom_level * 1.5, self.zoom_level * 1.5)
-        pix = page.get_pixmap(matrix=matrix)
-        
-        # Convert to PIL Image
-        img_data = pix.tobytes("ppm")
-        self.current_image = Image.open(io.BytesIO(img_data))
-        
-        # Convert to PhotoImage for display
-        self.photo_image = ImageTk.PhotoImage(self.current_image)
+        # Take the previous page image off the canvas before the next one
+        # is allocated
+        self.canvas.delete("pdf")
+        self.photo_image = None
         
-        # Update canvas
-        self.canvas.delete("all")
+        cache_key = (self.current_page, self.zoom_level)
+        with self._render_lock:
+            cached = self._page_cache.get(cache_key)
+            if cached is not None:
+                image, photo = cached
+            else:
+                image = self._render_page(self.current_page, self.zoom_level)
+                photo = None
+            
+            # PhotoImage must be built on the Tk main thread, so prefetched
+            # pages arrive without one. Release older cached photos first so
+            # at most PHOTO_CACHE_SIZE are alive, including the new one.
+            if photo is None:
+                self._trim_photos(self.PHOTO_CACHE_SIZE - 1)
+                photo = ImageTk.PhotoImage(image)
+            self._store_page(cache_key, image, photo)
+        
+        self.current_image = image
+        self.photo_image = photo
+        
+        # Update canvas, keeping the selection rectangle above the page
         self.canvas.create_image(0, 0, anchor=tk.NW, image=self.photo_image, tags="pdf")
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self.canvas.tag_raise(self.sel_item)
+        self.canvas.configure(scrollregion=self.canvas.bbox("pdf"))
         
         # Update page label
         self.page_label.config(text=f"Page: {self.current_page + 1} / {self.total_pages}")
         
         # Clear selection
+        self.canvas.itemconfigure(self.sel_item, state="hidden")
         self.selection_rect = None
-        self.selection_start = None
+        self._sx = self._sy = None
+        
+        # Users mostly page forward, so render the next page ahead of time
+        threading.Thread(
+            target=self._prefetch,
+            args=(self.pdf_document, self.current_page + 1, self.zoom_level),
+            daemon=True
+        ).start()
+        
+    def _render_page(self, page_num, zoom_level):
+        """Render a page of the open document to a PIL Image"""
+        page = self.pdf_document[page_num]
+        
+        # Render page to image with zoom
+        matrix = fitz.Matrix(zoom_level * 1.5, zoom_level * 1.5)
+        pix = page.get_pixmap(matrix=matrix)
+        
+        # Map the pixmap samples into a PIL Image without re-parsing
+        mode = "RGBA" if pix.alpha else "RGB"
+        return Image.frombuffer(mode, (pix.width, pix.height), pix.samples, "raw", mode, 0, 1)
+        
+    def _store_page(self, cache_key, image, photo):
+        """Insert a rendered page into the LRU cache, evicting the oldest"""
+        self._page_cache[cache_key] = (image, photo)
+        self._page_cache.move_to_end(cache_key)
+        if len(self._page_cache) > self.PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
+        
+        self._trim_photos(self.PHOTO_CACHE_SIZE)
+        
+    def _trim_photos(self, keep):
+        """Drop the PhotoImage of all but the `keep` most recent cached pages"""
+        photos = 0
+        for key in reversed(self._page_cache):
+            cached_image, cached_photo = self._page_cache[key]
+            if cached_photo is not None:
+                photos += 1
+                if photos > keep:
+                    self._page_cache[key] = (cached_image, None)
+        
+    def _prefetch(self, document, page_num, zoom_level):
+        """Render a page into the cache in the background"""
+        cache_key = (page_num, zoom_level)
+        with self._render_lock:
+            # Bail if another PDF was opened meanwhile or there's nothing to do
+            if document is not self.pdf_document or page_num >= self.total_pages:
+                return
+            if cache_key in self._page_cache:
+                return
+            self._store_page(cache_key, self._render_page(page_num, zoom_level), None)
         
     def prev_page(self):
         if self.pdf_document and self.current_page > 0:
@@ -319,35 +641,30 @@ class PDFOCRApp:
         if not self.current_image:
             return
         # Get canvas coordinates accounting for scroll
-        x = self.canvas.canvasx(event.x)
-        y = self.canvas.canvasy(event.y)
-        self.selection_start = (x, y)
+        self._sx = self.canvas.canvasx(event.x)
+        self._sy = self.canvas.canvasy(event.y)
         
-        # Remove existing selection rectangle
-        self.canvas.delete("selection")
+        # Restart the selection rectangle at the press point
+        self.canvas.coords(self.sel_item, self._sx, self._sy, self._sx, self._sy)
+        self.canvas.itemconfigure(self.sel_item, state="normal")
         
     def on_mouse_drag(self, event):
-        if not self.selection_start:
+        if self._sx is None:
             return
         x = self.canvas.canvasx(event.x)
         y = self.canvas.canvasy(event.y)
         
-        # Draw selection rectangle
-        self.canvas.delete("selection")
-        self.canvas.create_rectangle(
-            self.selection_start[0], self.selection_start[1],
-            x, y,
-            outline="red", width=2, tags="selection"
-        )
+        # Move the existing selection rectangle
+        self.canvas.coords(self.sel_item, self._sx, self._sy, x, y)
         
     def on_mouse_release(self, event):
-        if not self.selection_start:
+        if self._sx is None:
             return
         x = self.canvas.canvasx(event.x)
         y = self.canvas.canvasy(event.y)
         
         # Store selection coordinates
-        x1, y1 = self.selection_start
+        x1, y1 = self._sx, self._sy
         x2, y2 = x, y
         
         # Normalize coordinates (ensure x1 < x2, y1 < y2)
@@ -359,9 +676,9 @@ class PDFOCRApp:
         self.status_var.set(f"Selection: ({int(self.selection_rect[0])}, {int(self.selection_rect[1])}) to ({int(self.selection_rect[2])}, {int(self.selection_rect[3])})")
         
     def clear_selection(self):
-        self.canvas.delete("selection")
+        self.canvas.itemconfigure(self.sel_item, state="hidden")
         self.selection_rect = None
-        self.selection_start = None
+        self._sx = self._sy = None
         self.status_var.set("Selection cleared.")
         
     def ocr_current_page(self):
@@ -373,15 +690,21 @@ class PDFOCRApp:
         self.status_var.set(f"Performing OCR on current page using {engine}...")
         self.root.update()
         
-        def do_ocr():
+        document = self.pdf_document
+        page_num = self.current_page
+        
+        def do_ocr(generation):
             try:
-                text = OCREngine.perform_ocr(self.current_image, engine)
-                self.root.after(0, lambda: self.display_ocr_result(text, f"Page {self.current_page + 1} ({engine})"))
+                img = self._render_for_ocr(document, page_num)
+                text = OCREngine.perform_ocr(img, engine)
+                self._post(generation, lambda: self.display_ocr_result(text, f"Page {page_num + 1} ({engine})"))
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("OCR Error", str(e)))
-                self.root.after(0, lambda: self.status_var.set("OCR failed."))
+                # Bind the message now, `e` is cleared when the except block ends
+                message = str(e)
+                self._post(generation, lambda: messagebox.showerror("OCR Error", message))
+                self._post(generation, lambda: self.status_var.set("OCR failed."))
                 
-        threading.Thread(target=do_ocr, daemon=True).start()
+        self._submit_ocr(do_ocr)
         
     def ocr_selection(self):
         if not self.current_image:
@@ -392,22 +715,45 @@ class PDFOCRApp:
             messagebox.showwarning("Warning", "Please make a selection first.\nClick and drag on the PDF to select an area.")
             return
             
+        document = self.pdf_document
+        page_num = self.current_page
+        # Canvas coordinates are at preview scale (same 1.5 factor as
+        # display_page), convert them to PDF points
+        scale = self.zoom_level * 1.5
+        x1, y1, x2, y2 = self.selection_rect
+        clip = fitz.Rect(x1 / scale, y1 / scale, x2 / scale, y2 / scale)
+        
+        # Drags can run past the page edge; keep only the part on the page
+        width, height = self.current_image.size
+        clip.intersect(fitz.Rect(0, 0, width / scale, height / scale))
+        if clip.is_empty:
+            messagebox.showwarning("Warning", "The selection does not cover any part of the page.")
+            return
+        
         engine = self.selected_engine.get()
         self.status_var.set(f"Performing OCR on selection using {engine}...")
         self.root.update()
         
-        def do_ocr():
+        def do_ocr(generation):
             try:
-                # Crop the image to selection
-                x1, y1, x2, y2 = self.selection_rect
-                cropped = self.current_image.crop((int(x1), int(y1), int(x2), int(y2)))
-                text = OCREngine.perform_ocr(cropped, engine)
-                self.root.after(0, lambda: self.display_ocr_result(text, f"Selection ({engine})"))
+                # Rasterize only the selected area
+                img = self._render_for_ocr(document, page_num, clip)
+                text = OCREngine.perform_ocr(img, engine)
+                self._post(generation, lambda: self.display_ocr_result(text, f"Selection ({engine})"))
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("OCR Error", str(e)))
-                self.root.after(0, lambda: self.status_var.set("OCR failed."))
+                # Bind the message now, `e` is cleared when the except block ends
+                message = str(e)
+                self._post(generation, lambda: messagebox.showerror("OCR Error", message))
+                self._post(generation, lambda: self.status_var.set("OCR failed."))
                 
-        threading.Thread(target=do_ocr, daemon=True).start()
+        self._submit_ocr(do_ocr)
+        
+    def _render_for_ocr(self, document, page_num, clip=None):
+        """Render a page, or just the clip area of it, at OCR resolution"""
+        zoom = self.ocr_dpi / 72
+        with self._render_lock:
+            pix = document[page_num].get_pixmap(matrix=fitz.Matrix(zoom, zoom), clip=clip)
+        return _pix_to_array(pix)
         
     def ocr_entire_document(self):
         if not self.pdf_document:
@@ -418,29 +764,139 @@ class PDFOCRApp:
         self.status_var.set(f"Performing OCR on entire document using {engine}...")
         self.root.update()
         
-        def do_ocr():
+        pdf_path = self.pdf_path
+        total_pages = self.total_pages
+        skip_text_pages = self.skip_text_pages.get()
+        # Same resolution as page and selection OCR, so results match
+        zoom = self.ocr_dpi / 72
+        
+        # Pages are appended to the output as they finish
+        self.text_output.delete(1.0, tk.END)
+        
+        def do_ocr(generation):
             try:
-                all_text = []
-                for page_num in range(self.total_pages):
-                    self.root.after(0, lambda p=page_num: self.status_var.set(f"Processing page {p + 1} of {self.total_pages} using {engine}..."))
+                # Workers finish out of order; hold pages back until every
+                # earlier page has been written
+                pending = {}
+                next_page = 0
+                
+                def collect(page_results):
+                    nonlocal next_page
+                    for page_num, text, from_text_layer in page_results:
+                        pending[page_num] = (text, from_text_layer)
+                    while next_page in pending:
+                        text, from_text_layer = pending.pop(next_page)
+                        # Mark pages taken from the PDF's text layer rather than OCR
+                        source = " (text layer)" if from_text_layer else ""
+                        self._post(generation, lambda p=next_page, t=text, src=source: self.text_output.insert(tk.END, f"--- Page {p + 1}{src} ---\n{t}\n\n"))
+                        next_page += 1
+                
+                if engine == OCREngine.WINDOWS_OCR:
+                    # winocr is async-native, so batches run concurrently on this thread
+                    for start in range(0, total_pages, OCREngine.BATCH_SIZE):
+                        if not self._is_current(generation):
+                            return
+                        page_nums = list(range(start, min(start + OCREngine.BATCH_SIZE, total_pages)))
+                        self._post(generation, lambda p=start, n=len(page_nums): self.status_var.set(f"Processing pages {p + 1}-{p + n} of {total_pages} using {engine}..."))
+                        collect(_ocr_pages_worker(pdf_path, page_nums, engine, zoom, skip_text_pages, self._render_lock))
+                else:
+                    if not self._is_current(generation):
+                        return
+                    shared_reader = None
+                    if engine == OCREngine.EASYOCR:
+                        self._post(generation, lambda: self.status_var.set(f"Loading {engine} model..."))
+                        shared_reader = _share_easyocr_reader()
+                    # The model load takes seconds, check again before starting the pool
+                    if not self._is_current(generation):
+                        return
                     
-                    page = self.pdf_document[page_num]
-                    matrix = fitz.Matrix(1.5, 1.5)
-                    pix = page.get_pixmap(matrix=matrix)
+                    # EasyOCR amortizes model overhead over a batch of pages
+                    chunk = OCREngine.BATCH_SIZE if engine == OCREngine.EASYOCR else 1
                     
-                    img_data = pix.tobytes("ppm")
-                    img = Image.open(io.BytesIO(img_data))
+                    # No more workers than jobs, so short documents still get
+                    # all cores through torch's intra-op threads below.
+                    # Windows caps a process pool at 61 workers.
+                    workers = max(1, min(os.cpu_count() or 1, 61, (total_pages + chunk - 1) // chunk))
+                    if engine == OCREngine.EASYOCR and _cuda_available():
+                        # Every worker would load its own model copy onto the one GPU
+                        workers = 1
+                    num_threads = max(1, (os.cpu_count() or 1) // workers)
                     
-                    text = OCREngine.perform_ocr(img, engine)
-                    all_text.append(f"--- Page {page_num + 1} ---\n{text}\n")
+                    # Spawn rather than fork: this process runs Tk and other
+                    # threads whose locks a forked child would inherit held
+                    with ProcessPoolExecutor(
+                        max_workers=workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_worker_init,
+                        initargs=(engine, num_threads, shared_reader)
+                    ) as executor:
+                        futures = [
+                            executor.submit(_ocr_pages_worker, pdf_path, list(range(start, min(start + chunk, total_pages))), engine, zoom, skip_text_pages)
+                            for start in range(0, total_pages, chunk)
+                        ]
+                        done = 0
+                        for future in as_completed(futures):
+                            if not self._is_current(generation):
+                                # Superseded or closing, only wait for pages already running
+                                for pending_future in futures:
+                                    pending_future.cancel()
+                                return
+                            try:
+                                page_results = future.result()
+                            except Exception:
+                                # Leaving the with block waits for every queued
+                                # page, so drop those before reporting the error
+                                for pending_future in futures:
+                                    pending_future.cancel()
+                                raise
+                            collect(page_results)
+                            done += len(page_results)
+                            self._post(generation, lambda d=done: self.status_var.set(f"Processed {d} of {total_pages} pages using {engine}..."))
                     
-                full_text = "\n".join(all_text)
-                self.root.after(0, lambda: self.display_ocr_result(full_text, f"Entire Document ({engine})"))
+                    # Workers are gone, release the fp32 model (the executor
+                    # keeps it in its initargs too)
+                    executor = shared_reader = None
+                
+                self._post(generation, lambda: self.status_var.set(f"OCR complete: Entire Document ({engine})"))
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("OCR Error", str(e)))
-                self.root.after(0, lambda: self.status_var.set("OCR failed."))
+                # Bind the message now, `e` is cleared when the except block ends
+                message = str(e)
+                self._post(generation, lambda: messagebox.showerror("OCR Error", message))
+                self._post(generation, lambda: self.status_var.set("OCR failed."))
                 
-        threading.Thread(target=do_ocr, daemon=True).start()
+        self._submit_ocr(do_ocr)
+        
+    def _submit_ocr(self, do_ocr):
+        """Run an OCR job on the shared executor, superseding the previous one.
+        
+        A still-queued previous job is cancelled; a running one sees a stale
+        generation, stops at its next check and its output is dropped.
+        """
+        self._ocr_generation += 1
+        if self._ocr_future is not None:
+            self._ocr_future.cancel()
+        self._ocr_future = self._executor.submit(do_ocr, self._ocr_generation)
+        
+    def _is_current(self, generation):
+        """Check if an OCR job is still the newest one and the app is open"""
+        return generation == self._ocr_generation and not self._closing.is_set()
+        
+    def _post(self, generation, callback):
+        """Run callback on the Tk thread unless its OCR job has been superseded"""
+        def run():
+            if self._is_current(generation):
+                callback()
+        
+        if not self._closing.is_set():
+            self.root.after(0, run)
+        
+    def on_close(self):
+        """Drop queued OCR jobs and tell running ones to stop, then quit"""
+        self._closing.set()
+        if self._ocr_future is not None:
+            self._ocr_future.cancel()
+        self._executor.shutdown(wait=False)
+        self.root.destroy()
         
     def display_ocr_result(self, text, source):
         self.text_output.delete(1.0, tk.END)